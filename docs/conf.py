@@ -1,15 +1,15 @@
 import datetime
+import importlib.metadata
 import os
 
 # -- Project information -----------------------------------------------------
 
-import s2cell
 project = 's2cell'
 copyright = '2020-{}, Adam Liddell - Apache 2.0 License'.format(
     datetime.date.today().year
 )
 author = 'Adam Liddell'
-release = s2cell.__version__
+release = importlib.metadata.version('s2cell')
 version = release
 
 
@@ -1,8 +1,10 @@
+import shutil
+
 import nox
 
 
 nox.options.error_on_external_run = True
-nox.options.reuse_existing_virtualenvs = True
+nox.options.reuse_existing_virtualenvs = True  # Use 'nox -R' to also skip reinstalling packages
 nox.options.sessions = ['coverage', 'docs', 'ruff']
 
 
@@ -35,12 +37,11 @@ def docs(session):
     session.run(
         'python', '-m', 'sphinx',
         '-c', 'docs/',
-        '-a', # Update all output files
-        '-E', # Do not reuse environment from previous run
         '-T', # Show full trace on error
         '-W', # Treat warnings as errors
         '--keep-going', # When using -W, only exit after all warnings shown
-        #'-j', 'auto', # Generate in parallel
+        '-j', 'auto', # Generate in parallel
+        *session.posargs, # Pass '-a -E' to force a full rebuild, e.g. after changing conf.py
         'docs', 'docs/build',
     )
 
@@ -50,7 +51,7 @@ def upload_release(session):
     session.install('wheel', 'twine')
 
     # Clear out old dist files if they exist
-    session.run('rm', '-rf', 'dist', external=True)
+    shutil.rmtree('dist', ignore_errors=True)
 
     # Build sdist and wheel
     session.run('python', 'setup.py', 'sdist', 'bdist_wheel')
@@ -61,26 +61,41 @@ _S2_INVERT_MASK = 2
 # The number of bits per I and J in the lookup tables
 _S2_LOOKUP_BITS = 4
 
-# Lookup table for mapping 10 bits of IJ + orientation to 10 bits of Hilbert curve position +
-# orientation. Populated later by _s2_init_lookups
-_S2_LOOKUP_POS = None
-
-# Lookup table for mapping 10 bits of Hilbert curve position + orientation to 10 bits of IJ +
-# orientation. Populated later by _s2_init_lookups
-_S2_LOOKUP_IJ = None
-
 # Lookup table of two bits of IJ from two bits of curve position, based also on the current curve
 # orientation from the swap and invert bits
-_S2_POS_TO_IJ = [
-    [0, 1, 3, 2],  # 0: Normal order, no swap or invert
-    [0, 2, 3, 1],  # 1: Swap bit set, swap I and J bits
-    [3, 2, 0, 1],  # 2: Invert bit set, invert bits
-    [3, 1, 0, 2],  # 3: Swap and invert bits set
-]
+_S2_POS_TO_IJ = (
+    (0, 1, 3, 2),  # 0: Normal order, no swap or invert
+    (0, 2, 3, 1),  # 1: Swap bit set, swap I and J bits
+    (3, 2, 0, 1),  # 2: Invert bit set, invert bits
+    (3, 1, 0, 2),  # 3: Swap and invert bits set
+)
 
 # Lookup for the orientation update mask of one of the four sub-cells within a higher level cell.
 # This mask is XOR'ed with the current orientation to get the sub-cell orientation.
-_S2_POS_TO_ORIENTATION_MASK = [_S2_SWAP_MASK, 0, 0, _S2_SWAP_MASK | _S2_INVERT_MASK]
+_S2_POS_TO_ORIENTATION_MASK = (_S2_SWAP_MASK, 0, 0, _S2_SWAP_MASK | _S2_INVERT_MASK)
+
+# Lookup of the S2Point XYZ component indices and signs that give U and V for each face, along with
+# the index of the component used as the divisor. See _s2_xyz_to_face_uv for the derivation.
+# Face -> (U index, V index, divisor index, U sign, V sign)
+_S2_FACE_TO_UV_AXES = (
+    (1, 2, 0, 1.0, 1.0),  # 0: ( y,  z) / x
+    (0, 2, 1, -1.0, 1.0),  # 1: (-x,  z) / y
+    (0, 1, 2, -1.0, -1.0),  # 2: (-x, -y) / z
+    (2, 1, 0, 1.0, 1.0),  # 3: ( z,  y) / x
+    (2, 0, 1, 1.0, -1.0),  # 4: ( z, -x) / y
+    (1, 0, 2, -1.0, -1.0),  # 5: (-y, -x) / z
+)
+
+# Regex matching the characters allowed within a S2 token, which is 1 to 16 hex characters. This is
+# compiled once here rather than on each call, and is used with fullmatch() such that the whole
+# string must match
+_S2_TOKEN_REGEX = re.compile(r'[0-9a-fA-F]{1,16}')
+
+# Factors for converting between degrees and radians. These are the same factors used internally by
+# math.radians() and math.degrees(), so multiplying by these gives bit-identical results without
+# the function call overhead
+_DEG_TO_RAD = math.pi / 180.0
+_RAD_TO_DEG = 180.0 / math.pi
 
 
 #
@@ -130,8 +145,15 @@ def _s2_st_to_ij(component: float) -> int:
 
     """
     # The reference implementation does round(_S2_MAX_SIZE * component - 0.5), which is equivalent
-    # to math.floor(_S2_MAX_SIZE * component)
-    return int(max(0, min(_S2_MAX_SIZE - 1, math.floor(_S2_MAX_SIZE * component))))
+    # to math.floor(_S2_MAX_SIZE * component). Since the result is clamped to be non-negative, int()
+    # truncating towards zero gives the same result as floor for negative values. The clamping is
+    # done with comparisons rather than max() and min(), to avoid the function call overhead.
+    ij = int(_S2_MAX_SIZE * component)
+    if ij < 0:
+        return 0
+    if ij >= _S2_MAX_SIZE:
+        return _S2_MAX_SIZE - 1
+    return ij
 
 
 def _s2_si_ti_to_st(component: int) -> float:
@@ -162,6 +184,36 @@ def _s2_level_to_size_ij(level: int) -> int:
     return 1 << (_S2_MAX_LEVEL - level)
 
 
+def _s2_cell_id_to_level(cell_id: int) -> int:
+    """
+    Get the level for a S2 cell ID, without validating the cell ID.
+
+    This is used internally where the cell ID has already been validated, to avoid repeating the
+    validation. See cell_id_to_level for the public, validated version.
+
+    See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.h#L543-L551
+
+    Args:
+        cell_id: The valid S2 cell ID integer.
+
+    Returns:
+        The level of the S2 cell ID.
+
+    """
+    # Find the position of the lowest set one bit, which will be the trailing one bit. The level is
+    # given by the max level (30) minus the floored division by two of the position of the lowest
+    # set bit.
+    #
+    # The position of the lowest set bit is found using 'count trailing zeros', which would be
+    # equivalent to the C++20 function std::countr_zero() or the ctz instruction. In Python, this is
+    # done by isolating the lowest set bit with cell_id & -cell_id (two's complement negation flips
+    # all bits above the lowest set bit), then taking the bit length of the result minus one. A
+    # valid cell ID is always non-zero, so there is always a set bit to find.
+    lsb_pos = (cell_id & -cell_id).bit_length() - 1
+
+    return _S2_MAX_LEVEL - (lsb_pos >> 1)
+
+
 def _s2_point_to_face(s2_point: Tuple[float, float, float]) -> int:
     """
     Get the face containing a specific S2Point vector.
@@ -184,7 +236,17 @@ def _s2_point_to_face(s2_point: Tuple[float, float, float]) -> int:
     # -x -> 3
     # -y -> 4
     # -z -> 5
-    face = max(enumerate(s2_point), key=lambda p: abs(p[1]))[0]  # Largest absolute component
+    #
+    # The largest absolute component is found with direct comparisons, rather than a generic max()
+    # over the components, as this avoids the function call overhead. Ties resolve to the lowest
+    # index.
+    abs_x, abs_y, abs_z = abs(s2_point[0]), abs(s2_point[1]), abs(s2_point[2])
+    if abs_x >= abs_y and abs_x >= abs_z:
+        face = 0
+    elif abs_y >= abs_z:
+        face = 1
+    else:
+        face = 2
     if s2_point[face] < 0.0:
         face += 3
     return face
@@ -227,15 +289,17 @@ def _s2_xyz_to_face_uv(s2_point: Tuple[float, float, float]) -> Tuple[int, float
     # The negation of the the two components is then selected:
     # U: (face in [1, 2, 5]) ? -1: 1
     # V: (face in [2, 4, 5])) ? -1: 1
-    uv = (
-        s2_point[1 - ((face + 1) >> 1)] / s2_point[face % 3],  # U
-        s2_point[2 - (face >> 1)] / s2_point[face % 3]         # V
+    #
+    # Rather than evaluating these per call, the indices and signs for each face are precomputed in
+    # _S2_FACE_TO_UV_AXES. Multiplying by a sign of -1.0 is an exact negation, so the result is
+    # identical to negating after the division.
+    u_index, v_index, divisor_index, u_sign, v_sign = _S2_FACE_TO_UV_AXES[face]
+    divisor = s2_point[divisor_index]
+    return (
+        face,
+        u_sign * s2_point[u_index] / divisor,  # U
+        v_sign * s2_point[v_index] / divisor,  # V
     )
-    if face in (1, 2, 5):
-        uv = (-uv[0], uv[1])  # Negate U
-    if face in (2, 4, 5):
-        uv = (uv[0], -uv[1])  # Negate V
-    return face, uv[0], uv[1]
 
 
 def _s2_face_uv_to_xyz(
@@ -282,9 +346,9 @@ def _s2_face_uv_to_xyz(
     return s2_point
 
 
-def _s2_init_lookups() -> None:
+def _s2_init_lookups() -> Tuple[List[int], List[int]]:
     """
-    Initialise the S2 lookups in global vars _S2_LOOKUP_POS and _S2_LOOKUP_IJ.
+    Generate the S2 lookup tables for _S2_LOOKUP_POS and _S2_LOOKUP_IJ.
 
     This generates 4 variations of a 4 level deep Hilbert curve, one for each swap/invert bit
     combination. This allows mapping between 8 bits (+2 orientation) of Hilbert curve position and 8
@@ -296,50 +360,63 @@ def _s2_init_lookups() -> None:
 
     See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.cc#L75-L109
 
+    Returns:
+        Tuple containing the IJ to position lookup and the position to IJ lookup.
+
     """
-    global _S2_LOOKUP_POS, _S2_LOOKUP_IJ
-    if _S2_LOOKUP_POS is None or _S2_LOOKUP_IJ is None:  # pragma: no branch
-        # Initialise empty lookup tables
-        lookup_length = 1 << int(2 * _S2_LOOKUP_BITS + 2)  # = 1024
-        _S2_LOOKUP_POS = [0] * lookup_length
-        _S2_LOOKUP_IJ = [0] * lookup_length
-
-        # Generate lookups for each of the base orientations given by the swap and invert bits
-        for base_orientation in [
-            0, _S2_SWAP_MASK, _S2_INVERT_MASK, _S2_SWAP_MASK | _S2_INVERT_MASK  # 0-3 effectively
-        ]:
-            # Walk the 256 possible positions within a level 4 curve. This implementation is not
-            # the fastest since it does not reuse the common ancestor of neighbouring positions, but
-            # is simpler to read
-            for pos in range(4 ** 4):  # 4 levels of sub-divisions
-                ij = 0  # Has pattern iiiijjjj, not ijijijij
-                orientation = base_orientation
-
-                # Walk the pairs of bits of pos, from most significant to least, getting IJ and
-                # orientation as we go
-                for bit_pair_offset in range(4):
-                    # Bit pair is effectively the sub-cell index
-                    bit_pair = (pos >> ((3 - bit_pair_offset) * 2)) & 0b11
-
-                    # Get the I and J for the sub-cell index. These need to be spread into iiiijjjj
-                    # by inserting as bit positions 4 and 0
-                    ij_bits = _S2_POS_TO_IJ[orientation][bit_pair]
-                    ij = (
-                        (ij << 1)  # Free up position 4 and 0 from old IJ
-                        | ((ij_bits & 2) << 3)  # I bit in position 4
-                        | (ij_bits & 1)  # J bit in position 0
-                    )
-
-                    # Update the orientation with the new sub-cell orientation
-                    orientation = orientation ^ _S2_POS_TO_ORIENTATION_MASK[bit_pair]
-
-                # Shift IJ and position to allow orientation bits in LSBs of lookup
-                ij <<= 2
-                pos <<= 2
-
-                # Write lookups
-                _S2_LOOKUP_POS[ij | base_orientation] = pos | orientation
-                _S2_LOOKUP_IJ[pos | base_orientation] = ij | orientation
+    # Initialise empty lookup tables
+    lookup_length = 1 << (2 * _S2_LOOKUP_BITS + 2)  # = 1024
+    lookup_pos = [0] * lookup_length
+    lookup_ij = [0] * lookup_length
+
+    # Generate lookups for each of the base orientations given by the swap and invert bits
+    for base_orientation in [
+        0, _S2_SWAP_MASK, _S2_INVERT_MASK, _S2_SWAP_MASK | _S2_INVERT_MASK  # 0-3 effectively
+    ]:
+        # Walk the curve one level of sub-division at a time, expanding each curve segment into
+        # its four sub-cells. Each segment is tracked as its position, IJ and orientation, such
+        # that the work for a common ancestor is done once and shared by all of its descendants,
+        # rather than walking every bit pair again for each of the 256 final positions
+        segments = [(0, 0, base_orientation)]  # IJ has pattern iiiijjjj, not ijijijij
+        for _ in range(_S2_LOOKUP_BITS):  # 4 levels of sub-divisions
+            sub_segments = []
+            for pos, ij, orientation in segments:
+                pos_to_ij = _S2_POS_TO_IJ[orientation]
+
+                # Bit pair is effectively the sub-cell index
+                for bit_pair in range(4):
+                    # Get the I and J for the sub-cell index. These need to be spread into
+                    # iiiijjjj by inserting as bit positions 4 and 0
+                    ij_bits = pos_to_ij[bit_pair]
+                    sub_segments.append((
+                        (pos << 2) | bit_pair,  # Append sub-cell index to position
+                        (
+                            (ij << 1)  # Free up position 4 and 0 from old IJ
+                            | ((ij_bits & 2) << 3)  # I bit in position 4
+                            | (ij_bits & 1)  # J bit in position 0
+                        ),
+                        # Update the orientation with the new sub-cell orientation
+                        orientation ^ _S2_POS_TO_ORIENTATION_MASK[bit_pair],
+                    ))
+            segments = sub_segments
+
+        for pos, ij, orientation in segments:
+            # Shift IJ and position to allow orientation bits in LSBs of lookup
+            ij <<= 2
+            pos <<= 2
+
+            # Write lookups
+            lookup_pos[ij | base_orientation] = pos | orientation
+            lookup_ij[pos | base_orientation] = ij | orientation
+
+    return lookup_pos, lookup_ij
+
+
+# Lookup tables for mapping 10 bits of IJ + orientation to 10 bits of Hilbert curve position +
+# orientation (_S2_LOOKUP_POS) and vice versa (_S2_LOOKUP_IJ). These are populated once at import,
+# rather than checking whether they need populating on every encode and decode. This also avoids
+# concurrent first calls from multiple threads racing to initialise the tables
+_S2_LOOKUP_POS, _S2_LOOKUP_IJ = _s2_init_lookups()
 
 
 def s2_cell_id_to_face_ij(cell_id: int) -> Tuple[int, int, int]:
@@ -353,12 +430,10 @@ def s2_cell_id_to_face_ij(cell_id: int) -> Tuple[int, int, int]:
         Tuple containing the face and IJ coordinates.
 
     """
-    # Populate _S2_LOOKUP_IJ on first run.
+    # The _S2_LOOKUP_IJ table is populated at import by _s2_init_lookups.
     # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.cc#L75-L109
     # This table takes 10 bits of curve position and orientation and returns 10 bits of I and J and
     # new orientation
-    if _S2_LOOKUP_IJ is None:  # pragma: no cover
-        _s2_init_lookups()
 
     # Extract face + IJ from cell ID
     # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.cc#L312-L367
@@ -370,8 +445,10 @@ def s2_cell_id_to_face_ij(cell_id: int) -> Tuple[int, int, int]:
     # The swap bit swaps I and J with each other
     # The invert bit inverts the bits of I and J, which means axes are negated
     #
-    # In the first loop (most significant bits), the 3 bits occupied by the face need to be masked
-    # out, since these are not set in the IJ to cell ID during encoding.
+    # The 3 bits occupied by the face are masked out of the cell ID before the loop, since these are
+    # not set in the IJ to cell ID during encoding. This means the first loop (most significant
+    # bits) pulls out only the 4 remaining position bits, without needing a different mask to the
+    # other loops.
     #
     # The I and J returned here are of one of the two leaf (level 30) cells that are located
     # diagonally closest to the cell center. This happens because repeated ..00.. will select the
@@ -400,17 +477,15 @@ def s2_cell_id_to_face_ij(cell_id: int) -> Tuple[int, int, int]:
     # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.h#L503-L529
     #
     face = cell_id >> _S2_POS_BITS
+    position = cell_id & ((1 << _S2_POS_BITS) - 1)  # Cell ID with face bits removed
     bits = face & _S2_SWAP_MASK  # ppppppppoo. Initially set by by face
     lookup_mask = (1 << _S2_LOOKUP_BITS) - 1  # Mask of 4 one bits: 0b1111
+    extract_mask = (1 << (2 * _S2_LOOKUP_BITS)) - 1  # Mask of 8 one bits: 0b11111111
     i = 0
     j = 0
     for k in range(7, -1, -1):
-        # Pull out 8 bits of cell ID, except in first loop where we pull out only 4
-        n_bits = (_S2_MAX_LEVEL - 7 * _S2_LOOKUP_BITS) if k == 7 else _S2_LOOKUP_BITS
-        extract_mask = (1 << (2 * n_bits)) - 1  # 8 (or 4) one bits
-        bits += (
-            (cell_id >> (k * 2 * _S2_LOOKUP_BITS + 1)) & extract_mask
-        ) << 2
+        # Pull out 8 bits of cell ID, which will be only 4 in the first loop
+        bits += ((position >> (k * 2 * _S2_LOOKUP_BITS + 1)) & extract_mask) << 2
 
         # Map bits from ppppppppoo to iiiijjjjoo using lookup table
         bits = _S2_LOOKUP_IJ[bits]
@@ -440,13 +515,11 @@ def s2_face_ij_to_cell_id(face: int, i: int, j: int, level: int) -> int:
         The S2 cell ID integer.
 
     """
-    # Populate _S2_LOOKUP_POS on first run.
+    # The _S2_LOOKUP_POS table is populated at import by _s2_init_lookups.
     # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.cc#L75-L109
     #
     # This table takes 10 bits of I and J and orientation and returns 10 bits of curve position and
     # new orientation
-    if _S2_LOOKUP_POS is None:  # pragma: no cover
-        _s2_init_lookups()
 
     # Convert face + IJ to cell ID
     # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.cc#L256-L298
@@ -467,8 +540,8 @@ def s2_face_ij_to_cell_id(face: int, i: int, j: int, level: int) -> int:
     # that are occupied by the face bits.
     bits = face & _S2_SWAP_MASK  # iiiijjjjoo. Initially set by by face
     cell_id = face << (_S2_POS_BITS - 1)  # Insert face at second most signficant bits
-    lookup_mask = (1 << int(_S2_LOOKUP_BITS)) - 1  # Mask of 4 one bits: 0b1111
-    required_steps = math.ceil((level + 2) / 4) if level > 0 else 0
+    lookup_mask = (1 << _S2_LOOKUP_BITS) - 1  # Mask of 4 one bits: 0b1111
+    required_steps = (level + 5) // 4 if level > 0 else 0  # Integer ceil((level + 2) / 4)
     for k in range(7, 7 - required_steps, -1):
         # Grab 4 bits of each of I and J
         offset = k * _S2_LOOKUP_BITS
@@ -484,22 +557,18 @@ def s2_face_ij_to_cell_id(face: int, i: int, j: int, level: int) -> int:
         # Remove position bits, leaving just new swap and invert bits for the next round
         bits &= _S2_SWAP_MASK | _S2_INVERT_MASK  # Mask: 0b11
 
-    # Left shift and add trailing bit
-    # The trailing bit addition is disabled, as we are overwriting this below in the truncation
-    # anyway. This line is kept as an example of the full method for S2 cell ID creation as is done
-    # in the standard library versions.
-    cell_id = cell_id << 1  # + 1
-
-    # Truncate to desired level
-    # This is done by finding the mask of the trailing 1 bit for the specified level, then zeroing
-    # out all bits less significant than this, then finally setting the trailing 1 bit. This is
-    # still necessary to do even after a reduced number of steps `required_steps` above, since each
-    # step contains multiple levels that may need partial overwrite. Additionally, we need to add
-    # the trailing 1 bit, which is not yet set above.
+    # Left shift, add trailing bit and truncate to desired level
+    # The standard library versions left shift the position by one and add a trailing 1 bit, giving
+    # a level 30 cell ID, i.e. (cell_id << 1) + 1. Here the trailing bit addition is skipped, as it
+    # would be overwritten by the truncation anyway, so the shift is done as part of the truncation
+    # expression.
+    #
+    # The truncation is done by finding the mask of the trailing 1 bit for the specified level,
+    # then zeroing out all bits less significant than this, then finally setting the trailing 1
+    # bit. This is still necessary to do even after a reduced number of steps `required_steps`
+    # above, since each step contains multiple levels that may need partial overwrite.
     least_significant_bit_mask = 1 << (2 * (_S2_MAX_LEVEL - level))
-    cell_id = (cell_id & -least_significant_bit_mask) | least_significant_bit_mask
-
-    return cell_id  # noqa: RET504
+    return ((cell_id << 1) & -least_significant_bit_mask) | least_significant_bit_mask
 
 
 def _s2_face_ij_to_wrapped_cell_id(face: int, i: int, j: int, level: int) -> int:
@@ -576,8 +645,9 @@ def cell_id_to_token(cell_id: int) -> str:
     if cell_id == 0:
         return 'X'
 
-    # Convert cell ID to 16 character hex string and strip any implicit trailing zeros
-    return '{:016x}'.format(cell_id).rstrip('0')
+    # Convert cell ID to 16 character hex string and strip any implicit trailing zeros. The
+    # printf-style formatting is used here as it is the quickest to parse and apply
+    return ('%016x' % cell_id).rstrip('0')
 
 
 def token_to_cell_id(token: str) -> int:
@@ -596,7 +666,7 @@ def token_to_cell_id(token: str) -> int:
 
     Raises:
         TypeError: If the token is not str.
-        InvalidToken: If the token length is over 16.
+        InvalidToken: If the token length is over 16 or the token has trailing whitespace.
 
     """
     # Check input
@@ -607,15 +677,20 @@ def token_to_cell_id(token: str) -> int:
         raise InvalidToken('Cannot convert S2 token with length > 16 characters')
 
     # Check for the zero cell ID represented by the character 'x' or 'X' rather than as the empty
-    # string
-    if token in ('x', 'X'):
+    # string. The empty string is also treated as zero, as all its implicit zeros have been stripped
+    if token in ('x', 'X', ''):
         return 0
 
-    # Add stripped implicit zeros to create the full 16 character hex string
-    token = token + ('0' * (16 - len(token)))
+    # Reject trailing whitespace, which int() would otherwise silently strip before the shift below
+    # restores the implicit zeros. If the zeros were instead appended to the string, the whitespace
+    # would no longer be trailing and int() would fail on it
+    if token[-1].isspace():
+        raise InvalidToken('Cannot convert S2 token with trailing whitespace')
 
-    # Convert to cell ID by converting hex to int
-    return int(token, 16)
+    # Convert to cell ID by converting hex to int and restoring the stripped implicit trailing
+    # zeros. The zeros are restored by shifting the integer left by 4 bits per missing hex
+    # character, which avoids building the padded 16 character string
+    return int(token, 16) << (4 * (16 - len(token)))
 
 
 #
@@ -646,8 +721,8 @@ def lat_lon_to_cell_id(
         raise ValueError('S2 level must be integer >= 0 and <= 30')
 
     # Reuse constant expressions
-    lat_rad = math.radians(lat)
-    lon_rad = math.radians(lon)
+    lat_rad = lat * _DEG_TO_RAD
+    lon_rad = lon * _DEG_TO_RAD
     sin_lat_rad = math.sin(lat_rad)
     cos_lat_rad = math.cos(lat_rad)
     sin_lon_rad = math.sin(lon_rad)
@@ -698,7 +773,9 @@ def lat_lon_to_token(lat: float, lon: float, level: int = 30) -> str:
 
     """
     # Generate cell ID and convert to token
-    return cell_id_to_token(lat_lon_to_cell_id(lat=lat, lon=lon, level=level))
+    # The cell ID generated here is always a valid non-zero int, so the type check and zero token
+    # handling within cell_id_to_token are skipped and the hex conversion applied directly
+    return ('%016x' % lat_lon_to_cell_id(lat, lon, level)).rstrip('0')
 
 
 #
@@ -752,7 +829,7 @@ def cell_id_to_lat_lon(
 
     # Convert face + UV to S2Point XYZ
     # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2coords.h#L348-L357
-    s2_point = _s2_face_uv_to_xyz(face, uv)
+    x, y, z = _s2_face_uv_to_xyz(face, uv)
 
     # Normalise XYZ S2Point vector
     # This section is part of the reference implementation but is not necessary when mapping
@@ -760,15 +837,19 @@ def cell_id_to_lat_lon(
     # angles are geometrically similar. If anything, the normalisation process loses precision when
     # tested against the reference implementation, albeit not at a level that is important either
     # way. The code below is left for demonstration of the normalisation process.
-    # norm = math.sqrt(s2_point[0] ** 2 + s2_point[1] ** 2 + s2_point[2] ** 2)
-    # s2_point = (s2_point[0] / norm, s2_point[1] / norm, s2_point[2] / norm)
+    # norm = math.sqrt(x * x + y * y + z * z)
+    # x, y, z = (x / norm, y / norm, z / norm)
 
     # Map into lat/lon
     # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2latlng.h#L196-L205
-    lat_rad = math.atan2(s2_point[2], math.sqrt(s2_point[0] ** 2 + s2_point[1] ** 2))
-    lon_rad = math.atan2(s2_point[1], s2_point[0])
+    #
+    # As in the reference implementation, the squares are done by multiplication rather than with
+    # the power operator, which is both quicker and always correctly rounded (x ** 2 goes through
+    # the C library pow(), which can be one unit in the last place out)
+    lat_rad = math.atan2(z, math.sqrt(x * x + y * y))
+    lon_rad = math.atan2(y, x)
 
-    return (math.degrees(lat_rad), math.degrees(lon_rad))
+    return (lat_rad * _RAD_TO_DEG, lon_rad * _RAD_TO_DEG)
 
 
 def token_to_lat_lon(token: str) -> Tuple[float, float]:
@@ -861,22 +942,17 @@ def cell_id_is_valid(cell_id: int) -> bool:
     if not isinstance(cell_id, int):
         raise TypeError('Cannot decode S2 cell ID from type: {}'.format(type(cell_id)))
 
-    # Check for zero ID
-    # This avoids overflow warnings below when 1 gets added to max uint64
-    if cell_id == 0:
-        return False
-
-    # Check face bits
-    if (cell_id >> _S2_POS_BITS) > 5:
-        return False
-
-    # Check trailing 1 bit is in one of the even bit positions allowed for the 30 levels, using the
-    # mask: 0b0001010101010101010101010101010101010101010101010101010101010101 = 0x1555555555555555
-    lowest_set_bit = cell_id & (~cell_id + 1)
-    if not lowest_set_bit & 0x1555555555555555:
-        return False
-
-    return True  # Checks have passed, cell ID must be valid
+    # The checks are combined into one short-circuiting expression:
+    # - Check for zero ID, which has no trailing 1 bit
+    # - Check face bits are in the range 0 to 5
+    # - Check trailing 1 bit is in one of the even bit positions allowed for the 30 levels. The
+    #   lowest set bit is isolated with cell_id & -cell_id, then checked against the mask:
+    #   0b0001010101010101010101010101010101010101010101010101010101010101 = 0x1555555555555555
+    return (
+        cell_id != 0
+        and (cell_id >> _S2_POS_BITS) <= 5
+        and (cell_id & -cell_id) & 0x1555555555555555 != 0
+    )
 
 
 def token_is_valid(token: str) -> bool:
@@ -902,7 +978,7 @@ def token_is_valid(token: str) -> bool:
         raise TypeError('Cannot check S2 token with type: {}'.format(type(token)))
 
     # First check string with regex
-    if not re.match(r'^[0-9a-fA-F]{1,16}$', token):
+    if not _S2_TOKEN_REGEX.fullmatch(token):
         return False
 
     # Check the contained cell ID is valid
@@ -934,20 +1010,7 @@ def cell_id_to_level(cell_id: int) -> int:
     if not cell_id_is_valid(cell_id):
         raise InvalidCellID('Cannot decode invalid S2 cell ID: {}'.format(cell_id))
 
-    # Find the position of the lowest set one bit, which will be the trailing one bit. The level is
-    # given by the max level (30) minus the floored division by two of the position of the lowest
-    # set bit.
-    #
-    # The position of the lowest set bit is found using 'count trailing zeros', which would be
-    # equivalent to the C++20 function std::countr_zero() or the ctz instruction.
-    lsb_pos = 0
-    while cell_id != 0:  # pragma: no branch
-        if cell_id & 1:
-            break
-        lsb_pos += 1
-        cell_id >>= 1
-
-    return int(_S2_MAX_LEVEL - (lsb_pos >> 1))
+    return _s2_cell_id_to_level(cell_id)
 
 
 def token_to_level(token: str) -> int:
@@ -973,8 +1036,9 @@ def token_to_level(token: str) -> int:
     if not token_is_valid(token):
         raise InvalidToken('Cannot decode invalid S2 token: {}'.format(token))
 
-    # Convert to cell ID and get the level for that
-    return cell_id_to_level(token_to_cell_id(token))
+    # Convert to cell ID and get the level for that. The contained cell ID has already been
+    # validated by the token check above, so this does not need to be repeated
+    return _s2_cell_id_to_level(token_to_cell_id(token))
 
 
 #
@@ -1008,8 +1072,9 @@ def cell_id_to_parent_cell_id(
     if not cell_id_is_valid(cell_id):
         raise InvalidCellID('Cannot decode invalid S2 cell ID: {}'.format(cell_id))
 
-    # Get current level of the cell ID and check it is suitable with the requested level
-    current_level = cell_id_to_level(cell_id)
+    # Get current level of the cell ID and check it is suitable with the requested level. The cell
+    # ID has already been validated above, so this does not need to be repeated
+    current_level = _s2_cell_id_to_level(cell_id)
     if level is None and current_level == 0:
         raise ValueError('Cannot get parent cell ID of a level 0 cell ID')
     if level is None:
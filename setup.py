@@ -1,5 +1,4 @@
 import pathlib
-import re
 
 import setuptools
 
@@ -7,7 +6,10 @@ import setuptools
 # Load version
 # Cannot import the package at this point, as dependencies are missing
 init_file = pathlib.Path(__file__).parent / 's2cell' / '__init__.py'
-__version__ = re.search(r"^__version__ = '(.*?)'$", init_file.read_text(), re.MULTILINE).group(1)
+for line in init_file.read_text().splitlines():
+    if line.startswith('__version__ = '):
+        __version__ = line.split("'")[1]
+        break
 
 # Load readme as long description
 with open('README.rst') as file:
@@ -20,7 +20,84 @@ import re
 
 import pytest
 import s2cell
-from s2cell.s2cell import _S2_POS_BITS, _s2_face_uv_to_xyz
+from s2cell.s2cell import (
+    _S2_LOOKUP_IJ,
+    _S2_LOOKUP_POS,
+    _S2_MAX_SIZE,
+    _S2_POS_BITS,
+    _s2_face_uv_to_xyz,
+    _s2_st_to_ij,
+)
+
+# Number of chunks each compatibility corpus is split into, such that the rows of a large corpus can
+# be checked in parallel when running under pytest-xdist
+CORPUS_CHUNKS = 4
+
+# Escaped error messages that are matched repeatedly, including within the corpus loops
+INVALID_LEVEL_MATCH = re.escape('S2 level must be integer >= 0 and <= 30')
+LEVEL_0_PARENT_MATCH = re.escape('Cannot get parent cell ID of a level 0 cell ID')
+
+# Cell ID with the invalid face 6 set in the face bits, and its token
+FACE_6_CELL_ID = 0b110 << _S2_POS_BITS
+FACE_6_TOKEN = '{:016x}'.format(FACE_6_CELL_ID)
+
+
+# Typed row of the generated S2 encode and decode corpora
+CorpusRow = collections.namedtuple('CorpusRow', ['cell_id', 'token', 'lat', 'lon', 'level'])
+
+# Typed row of the generated S2 neighbor corpus, with the neighbors as sets of cell IDs
+NeighborCorpusRow = collections.namedtuple(
+    'NeighborCorpusRow', ['cell_id', 'edge_neighbors', 'all_neighbors']
+)
+
+
+def _load_corpus(name):
+    # Parse a generated S2 encode or decode corpus into typed rows. The column order differs between
+    # corpora, so the column indices are found from the header. A plain csv.reader is used rather
+    # than csv.DictReader, to avoid building a dict for every row
+    corpus_file = pathlib.Path(__file__).parent / 's2_{}_corpus.csv.gz'.format(name)
+    with gzip.open(str(corpus_file), 'rt') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        cell_id_idx, token_idx, lat_idx, lon_idx, level_idx = (
+            header.index(field) for field in CorpusRow._fields
+        )
+        return [
+            CorpusRow(
+                int(row[cell_id_idx]), row[token_idx], float(row[lat_idx]), float(row[lon_idx]),
+                int(row[level_idx])
+            )
+            for row in reader
+        ]
+
+
+@pytest.fixture(scope='session')
+def encode_corpus():
+    # Rows of generated S2 encode tests, parsed once and shared by all tests using them
+    return _load_corpus('encode')
+
+
+@pytest.fixture(scope='session')
+def decode_corpus():
+    # Rows of generated S2 decode tests, parsed once and shared by all tests using them
+    return _load_corpus('decode')
+
+
+@pytest.fixture(scope='session')
+def neighbor_corpus():
+    # Rows of generated S2 neighbor tests, parsed once and shared by all tests using them
+    neighbor_file = pathlib.Path(__file__).parent / 's2_neighbor_corpus.csv.gz'
+    with gzip.open(str(neighbor_file), 'rt') as f:
+        reader = csv.reader(f)
+        assert tuple(next(reader)) == NeighborCorpusRow._fields
+        return [
+            NeighborCorpusRow(
+                int(cell_id),
+                {int(neighbor) for neighbor in edge_neighbors.split(':')},
+                {int(neighbor) for neighbor in all_neighbors.split(':')},
+            )
+            for cell_id, edge_neighbors, all_neighbors in reader
+        ]
 
 
 def test_invalid__s2_face_uv_to_xyz():
@@ -28,6 +105,47 @@ def test_invalid__s2_face_uv_to_xyz():
         _s2_face_uv_to_xyz(6, (0, 0))
 
 
+@pytest.mark.parametrize('component, expected', [
+    (-1.0, 0),  # Clamped to face
+    (-1e-12, 0),
+    (0.0, 0),
+    (0.5, _S2_MAX_SIZE >> 1),
+    (1.0, _S2_MAX_SIZE - 1),  # Clamped to face
+    (2.0, _S2_MAX_SIZE - 1),  # Clamped to face
+])
+def test__s2_st_to_ij(component, expected):
+    assert _s2_st_to_ij(component) == expected
+
+
+def test__s2_init_lookups():
+    # Build the lookup tables with a direct port of the recursive reference implementation
+    # See s2geometry/blob/c59d0ca01ae3976db7f8abdc83fcc871a3a95186/src/s2/s2cell_id.cc#L75-L109
+    pos_to_ij = ((0, 1, 3, 2), (0, 2, 3, 1), (3, 2, 0, 1), (3, 1, 0, 2))
+    pos_to_orientation = (1, 0, 0, 3)
+    lookup_pos = [0] * 1024
+    lookup_ij = [0] * 1024
+
+    def init_lookup_cell(level, i, j, orig_orientation, pos, orientation):
+        if level == 4:
+            ij = (i << 4) + j
+            lookup_pos[(ij << 2) + orig_orientation] = (pos << 2) + orientation
+            lookup_ij[(pos << 2) + orig_orientation] = (ij << 2) + orientation
+            return
+
+        for bit_pair in range(4):
+            ij_bits = pos_to_ij[orientation][bit_pair]
+            init_lookup_cell(
+                level + 1, (i << 1) + (ij_bits >> 1), (j << 1) + (ij_bits & 1), orig_orientation,
+                (pos << 2) + bit_pair, orientation ^ pos_to_orientation[bit_pair]
+            )
+
+    for orientation in range(4):
+        init_lookup_cell(0, 0, 0, orientation, 0, orientation)
+
+    assert lookup_pos == _S2_LOOKUP_POS
+    assert lookup_ij == _S2_LOOKUP_IJ
+
+
 def test_zero_cell_id_to_token():
     assert s2cell.cell_id_to_token(0) == 'X'
 
@@ -37,12 +155,11 @@ def test_invalid_cell_id_to_token():
         s2cell.cell_id_to_token(1.0)
 
 
-def test_cell_id_to_token_compat():
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_cell_id_to_token_compat(encode_corpus, chunk):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.cell_id_to_token(int(row['cell_id'])) == row['token']
+    for row in encode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.cell_id_to_token(row.cell_id) == row.token
 
 
 def test_zero_token_to_cell_id():
@@ -57,57 +174,46 @@ def test_invalid_token_to_cell_id():
     with pytest.raises(s2cell.InvalidToken, match=re.escape('Cannot convert S2 token with length > 16 characters')):
         s2cell.token_to_cell_id('a' * 17)
 
+    with pytest.raises(s2cell.InvalidToken, match=re.escape('Cannot convert S2 token with trailing whitespace')):
+        s2cell.token_to_cell_id('2ef\n')
 
-def test_token_to_cell_id_compat():
-    # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.token_to_cell_id(row['token']) == int(row['cell_id'])
+    with pytest.raises(s2cell.InvalidToken, match=re.escape('Cannot convert S2 token with trailing whitespace')):
+        s2cell.token_to_cell_id('2ef ')
 
 
-def test_invalid_lat_lon_to_cell_id():
-    # Invalid level
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
-        s2cell.lat_lon_to_cell_id(0, 0, level=-1)
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_token_to_cell_id_compat(encode_corpus, chunk):
+    # Check against generated S2 tests
+    for row in encode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.token_to_cell_id(row.token) == row.cell_id
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
-        s2cell.lat_lon_to_cell_id(0, 0, level=31)
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
-        s2cell.lat_lon_to_cell_id(0, 0, level='a')
+@pytest.mark.parametrize('level', [-1, 31, 'a'])
+def test_invalid_lat_lon_to_cell_id(level):
+    # Invalid level
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
+        s2cell.lat_lon_to_cell_id(0, 0, level=level)
 
 
-def test_lat_lon_to_cell_id_compat():
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_lat_lon_to_cell_id_compat(encode_corpus, chunk):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.lat_lon_to_cell_id(
-                float(row['lat']), float(row['lon']), int(row['level'])
-            ) == int(row['cell_id'])
+    for row in encode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.lat_lon_to_cell_id(row.lat, row.lon, row.level) == row.cell_id
 
 
-def test_invalid_lat_lon_to_token():
+@pytest.mark.parametrize('level', [-1, 31, 'a'])
+def test_invalid_lat_lon_to_token(level):
     # Invalid level
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
-        s2cell.lat_lon_to_token(0, 0, level=-1)
-
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
-        s2cell.lat_lon_to_token(0, 0, level=31)
-
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
-        s2cell.lat_lon_to_token(0, 0, level='a')
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
+        s2cell.lat_lon_to_token(0, 0, level=level)
 
 
-def test_lat_lon_to_token_compat():
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_lat_lon_to_token_compat(encode_corpus, chunk):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.lat_lon_to_token(
-                float(row['lat']), float(row['lon']), int(row['level'])
-            ) == row['token']
+    for row in encode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.lat_lon_to_token(row.lat, row.lon, row.level) == row.token
 
 
 def test_invalid_cell_id_to_lat_lon():
@@ -115,16 +221,17 @@ def test_invalid_cell_id_to_lat_lon():
         s2cell.cell_id_to_lat_lon(1.0)
 
     with pytest.raises(s2cell.InvalidCellID, match=re.escape('Cannot decode invalid S2 cell ID: 13835058055282163712')):
-        s2cell.cell_id_to_lat_lon(int(0b110 << _S2_POS_BITS))
+        s2cell.cell_id_to_lat_lon(FACE_6_CELL_ID)
 
 
-def test_cell_id_to_lat_lon_compat():
-    decode_file = pathlib.Path(__file__).parent / 's2_decode_corpus.csv.gz'
-    with gzip.open(str(decode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            ll_tuple = s2cell.cell_id_to_lat_lon(int(row['cell_id']))
-            expected_tuple = (float(row['lat']), float(row['lon']))
-            assert ll_tuple == pytest.approx(expected_tuple, abs=1e-12, rel=0.0)
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_cell_id_to_lat_lon_compat(decode_corpus, chunk):
+    # Compare the whole chunk with a single approx over the flattened lat/lon values, rather than
+    # building one approx per row
+    rows = decode_corpus[chunk::CORPUS_CHUNKS]
+    lat_lons = [value for row in rows for value in s2cell.cell_id_to_lat_lon(row.cell_id)]
+    expected_lat_lons = [value for row in rows for value in (row.lat, row.lon)]
+    assert lat_lons == pytest.approx(expected_lat_lons, abs=1e-12, rel=0.0)
 
 
 def test_invalid_token_to_lat_lon():
@@ -135,16 +242,17 @@ def test_invalid_token_to_lat_lon():
         s2cell.token_to_lat_lon('a' * 17)
 
     with pytest.raises(s2cell.InvalidToken, match=re.escape('Cannot decode invalid S2 token: c000000000000000')):
-        s2cell.token_to_lat_lon('{:016x}'.format(0b110 << _S2_POS_BITS))
+        s2cell.token_to_lat_lon(FACE_6_TOKEN)
 
 
-def test_token_to_lat_lon_compat():
-    decode_file = pathlib.Path(__file__).parent / 's2_decode_corpus.csv.gz'
-    with gzip.open(str(decode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            ll_tuple = s2cell.token_to_lat_lon(row['token'])
-            expected_tuple = (float(row['lat']), float(row['lon']))
-            assert ll_tuple == pytest.approx(expected_tuple, abs=1e-12, rel=0.0)
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_token_to_lat_lon_compat(decode_corpus, chunk):
+    # Compare the whole chunk with a single approx over the flattened lat/lon values, rather than
+    # building one approx per row
+    rows = decode_corpus[chunk::CORPUS_CHUNKS]
+    lat_lons = [value for row in rows for value in s2cell.token_to_lat_lon(row.token)]
+    expected_lat_lons = [value for row in rows for value in (row.lat, row.lon)]
+    assert lat_lons == pytest.approx(expected_lat_lons, abs=1e-12, rel=0.0)
 
 
 @pytest.mark.parametrize('token, expected', [
@@ -175,11 +283,10 @@ def test_cell_id_is_valid(cell_id, is_valid):
     assert s2cell.cell_id_is_valid(cell_id) == is_valid
 
 
-def test_cell_id_is_valid_compat():
-    decode_file = pathlib.Path(__file__).parent / 's2_decode_corpus.csv.gz'
-    with gzip.open(str(decode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.cell_id_is_valid(int(row['cell_id']))
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_cell_id_is_valid_compat(decode_corpus, chunk):
+    for row in decode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.cell_id_is_valid(row.cell_id)
 
 
 @pytest.mark.parametrize('token, is_valid', [
@@ -193,16 +300,17 @@ def test_cell_id_is_valid_compat():
     ('2efinvalid', False),  # Invalid characters
     ('86R', False),  # Invalid hex
     ('2efx', False),  # Incorrect use of X
+    ('2ef\n', False),  # Trailing newline
+    ('2ef ', False),  # Trailing space
 ])
 def test_token_is_valid(token, is_valid):
     assert s2cell.token_is_valid(token) == is_valid
 
 
-def test_token_is_valid_compat():
-    decode_file = pathlib.Path(__file__).parent / 's2_decode_corpus.csv.gz'
-    with gzip.open(str(decode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.token_is_valid(row['token'])
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_token_is_valid_compat(decode_corpus, chunk):
+    for row in decode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.token_is_valid(row.token)
 
 
 def test_invalid_cell_id_to_level():
@@ -213,12 +321,11 @@ def test_invalid_cell_id_to_level():
         s2cell.cell_id_to_level(0)
 
 
-def test_cell_id_to_level_compat():
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_cell_id_to_level_compat(encode_corpus, chunk):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.cell_id_to_level(int(row['cell_id'])) == int(row['level'])
+    for row in encode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.cell_id_to_level(row.cell_id) == row.level
 
 
 def test_invalid_token_to_level():
@@ -232,12 +339,11 @@ def test_invalid_token_to_level():
         s2cell.token_to_level('')
 
 
-def test_token_to_level_compat():
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_token_to_level_compat(encode_corpus, chunk):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            assert s2cell.token_to_level(row['token']) == int(row['level'])
+    for row in encode_corpus[chunk::CORPUS_CHUNKS]:
+        assert s2cell.token_to_level(row.token) == row.level
 
 
 def test_invalid_cell_id_to_parent_cell_id():
@@ -247,29 +353,27 @@ def test_invalid_cell_id_to_parent_cell_id():
     with pytest.raises(s2cell.InvalidCellID, match=re.escape('Cannot decode invalid S2 cell ID: 0')):
         s2cell.cell_id_to_parent_cell_id(0)
 
-    with pytest.raises(ValueError, match=re.escape('Cannot get parent cell ID of a level 0 cell ID')):
+    with pytest.raises(ValueError, match=LEVEL_0_PARENT_MATCH):
         s2cell.cell_id_to_parent_cell_id(3458764513820540928)
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
         s2cell.cell_id_to_parent_cell_id(3383782026652942336, 'a')
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
         s2cell.cell_id_to_parent_cell_id(3383782026652942336, -1)
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
         s2cell.cell_id_to_parent_cell_id(3383782026652942336, 31)
 
     with pytest.raises(ValueError, match=re.escape('Cannot get level 16 parent cell ID of cell ID with level 15')):
         s2cell.cell_id_to_parent_cell_id(3383782026652942336, 16)
 
 
-def test_cell_id_to_parent_cell_id_compat():
+def test_cell_id_to_parent_cell_id_compat(encode_corpus):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        points = collections.defaultdict(dict)
-        for row in csv.DictReader(f):
-            points[(float(row['lat']), float(row['lon']))][int(row['level'])] = int(row['cell_id'])
+    points = collections.defaultdict(dict)
+    for row in encode_corpus:
+        points[(row.lat, row.lon)][row.level] = row.cell_id
 
     for levels_dict in list(points.values())[::200]:
         for level in levels_dict:
@@ -277,7 +381,7 @@ def test_cell_id_to_parent_cell_id_compat():
             if level > 0:
                 assert s2cell.cell_id_to_parent_cell_id(levels_dict[level]) == levels_dict[level - 1]
             else:
-                with pytest.raises(ValueError, match=re.escape('Cannot get parent cell ID of a level 0 cell ID')):
+                with pytest.raises(ValueError, match=LEVEL_0_PARENT_MATCH):
                     s2cell.cell_id_to_parent_cell_id(levels_dict[level])
 
             # Test all other levels
@@ -296,29 +400,27 @@ def test_invalid_token_to_parent_token():
     with pytest.raises(s2cell.InvalidToken, match=re.escape('Cannot decode invalid S2 token: aaaaaaaaaaaaaaaaa')):
         s2cell.token_to_parent_token('a' * 17)
 
-    with pytest.raises(ValueError, match=re.escape('Cannot get parent cell ID of a level 0 cell ID')):
+    with pytest.raises(ValueError, match=LEVEL_0_PARENT_MATCH):
         s2cell.token_to_parent_token('3')
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
         s2cell.token_to_parent_token('2ef59bd34', 'a')
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
         s2cell.token_to_parent_token('2ef59bd34', -1)
 
-    with pytest.raises(ValueError, match=re.escape('S2 level must be integer >= 0 and <= 30')):
+    with pytest.raises(ValueError, match=INVALID_LEVEL_MATCH):
         s2cell.token_to_parent_token('2ef59bd34', 31)
 
     with pytest.raises(ValueError, match=re.escape('Cannot get level 16 parent cell ID of cell ID with level 15')):
         s2cell.token_to_parent_token('2ef59bd34', 16)
 
 
-def test_token_to_parent_token_compat():
+def test_token_to_parent_token_compat(encode_corpus):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_encode_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        points = collections.defaultdict(dict)
-        for row in csv.DictReader(f):
-            points[(float(row['lat']), float(row['lon']))][int(row['level'])] = row['token']
+    points = collections.defaultdict(dict)
+    for row in encode_corpus:
+        points[(row.lat, row.lon)][row.level] = row.token
 
     for levels_dict in list(points.values())[::200]:
         for level in levels_dict:
@@ -326,7 +428,7 @@ def test_token_to_parent_token_compat():
             if level > 0:
                 assert s2cell.token_to_parent_token(levels_dict[level]) == levels_dict[level - 1]
             else:
-                with pytest.raises(ValueError, match=re.escape('Cannot get parent cell ID of a level 0 cell ID')):
+                with pytest.raises(ValueError, match=LEVEL_0_PARENT_MATCH):
                     s2cell.token_to_parent_token(levels_dict[level])
 
             # Test all other levels
@@ -404,12 +506,9 @@ def test_cell_id_to_neighbor_cell_ids_at_cube_corner():
     assert neighbors == expected_neighbors
 
 
-def test_cell_id_to_neighbor_cell_ids_compat():
+@pytest.mark.parametrize('chunk', range(CORPUS_CHUNKS))
+def test_cell_id_to_neighbor_cell_ids_compat(neighbor_corpus, chunk):
     # Check against generated S2 tests
-    encode_file = pathlib.Path(__file__).parent / 's2_neighbor_corpus.csv.gz'
-    with gzip.open(str(encode_file), 'rt') as f:
-        for row in csv.DictReader(f):
-            edge_neighbors = {int(cell_id) for cell_id in row['edge_neighbors'].split(':')}
-            all_neighbors = {int(cell_id) for cell_id in row['all_neighbors'].split(':')}
-            assert set(s2cell.cell_id_to_neighbor_cell_ids(int(row['cell_id']))) == edge_neighbors
-            assert set(s2cell.cell_id_to_neighbor_cell_ids(int(row['cell_id']), corner=True)) == all_neighbors
+    for row in neighbor_corpus[chunk::CORPUS_CHUNKS]:
+        assert set(s2cell.cell_id_to_neighbor_cell_ids(row.cell_id)) == row.edge_neighbors
+        assert set(s2cell.cell_id_to_neighbor_cell_ids(row.cell_id, corner=True)) == row.all_neighbors